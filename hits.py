@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import customtkinter as ctk
 from pyjmine import PyJMine
 from pyjmine import Mappings, MappingsType
@@ -14,43 +16,89 @@ mappings = Mappings(
 )
 
 # Fetch Minecraft classes
-minecraft_mappings = mappings.fetch('net.minecraft.client.Minecraft')
+class_mappings = mappings.fetch_many([
+    'net.minecraft.client.Minecraft',
+    'net.minecraft.world.entity.Entity',
+    'net.minecraft.world.phys.AABB'
+])
+
+minecraft_mappings = class_mappings['net.minecraft.client.Minecraft']
 Minecraft = pjm.get_class(minecraft_mappings)
 
-entity_mappings = mappings.fetch('net.minecraft.world.entity.Entity')
+entity_mappings = class_mappings['net.minecraft.world.entity.Entity']
 Entity = pjm.get_class(entity_mappings)
 
-aabb_mappings = mappings.fetch('net.minecraft.world.phys.AABB')
+aabb_mappings = class_mappings['net.minecraft.world.phys.AABB']
 AABB = pjm.get_class(aabb_mappings)
 
-def update_hitboxes(hit_scale=0.6):
+# Half-width difference below which the hitbox is considered unchanged
+HITBOX_TOLERANCE = 1e-4
+
+@dataclass(frozen=True)
+class _HitboxCtx:
+    """AABB constructor and reflection handles resolved once at startup for update_hitboxes."""
+    aabb_jclass: object
+    get_instance: object
+    player: object
+    get_bounding_box: object
+    set_bounding_box: object
+    min_x: object
+    max_x: object
+    min_y: object
+    max_y: object
+    min_z: object
+    max_z: object
+
+# Resolve reflection handles once so the slider callback skips the mapping lookups
+_CTX = _HitboxCtx(
+    aabb_jclass=AABB.jclass,
+    get_instance=Minecraft.resolve('getInstance'),
+    player=Minecraft.resolve('player'),
+    get_bounding_box=Entity.resolve('getBoundingBox'),
+    set_bounding_box=Entity.resolve(
+        'setBoundingBox',
+        num_params=1,
+        param_types=[aabb_mappings.get('obfuscated_class_name')],
+        return_type='void'
+    ),
+    min_x=AABB.resolve('minX'),
+    max_x=AABB.resolve('maxX'),
+    min_y=AABB.resolve('minY'),
+    max_y=AABB.resolve('maxY'),
+    min_z=AABB.resolve('minZ'),
+    max_z=AABB.resolve('maxZ'),
+)
+
+def update_hitboxes(hit_scale=0.6, _ctx=_CTX):
     """Update the player's hitbox in Minecraft."""
-    minecraft_instance = Minecraft.getInstance()
+    minecraft_instance = _ctx.get_instance.invoke(None)
     print(minecraft_instance)
     if minecraft_instance:
-        Minecraft.set_instance(minecraft_instance)
-        player_instance = Minecraft.player
+        player_instance = _ctx.player.get(minecraft_instance)
         if player_instance:
-            Entity.set_instance(player_instance)
-            aabb = Entity.getBoundingBox()
-            AABB.set_instance(aabb)
+            aabb = _ctx.get_bounding_box.invoke(player_instance)
 
-            min_x = AABB.minX
-            max_x = AABB.maxX
+            min_x = _ctx.min_x.get(aabb)
+            max_x = _ctx.max_x.get(aabb)
 
             center_x = (min_x + max_x) / 2.0
 
-            min_y = AABB.minY
-            max_y = AABB.maxY
+            min_y = _ctx.min_y.get(aabb)
+            max_y = _ctx.max_y.get(aabb)
 
-            min_z = AABB.minZ
-            max_z = AABB.maxZ
+            min_z = _ctx.min_z.get(aabb)
+            max_z = _ctx.max_z.get(aabb)
 
             center_z = (min_z + max_z) / 2.0
 
             new_half_width = hit_scale / 2.0
 
-            aabb_instance = AABB.jclass(
+            # Skip the allocation and write when the current box already has this width
+            if (abs((max_x - min_x) / 2.0 - new_half_width) < HITBOX_TOLERANCE and
+                    abs((max_z - min_z) / 2.0 - new_half_width) < HITBOX_TOLERANCE):
+                return
+
+            aabb_instance = _ctx.aabb_jclass(
                 center_x - new_half_width,
                 min_y,
                 center_z - new_half_width,
@@ -59,16 +107,23 @@ def update_hitboxes(hit_scale=0.6):
                 center_z + new_half_width
             )
 
-            Entity.setBoundingBox(
-                aabb_instance,
-                num_params=1,
-                param_types=[aabb_mappings.get('obfuscated_class_name')],
-                return_type='void'
-            )
+            _ctx.set_bounding_box.invoke(player_instance, aabb_instance)
+
+# Delay before applying a slider value, so a drag triggers one update instead of one per motion event
+HITBOX_UPDATE_DELAY_MS = 30
+_pending_update = None
+
+def _apply_hitbox_scale(hit_scale):
+    global _pending_update
+    _pending_update = None
+    update_hitboxes(hit_scale=hit_scale)
 
 # Create a simple UI to adjust the hitbox scale
 def on_hitbox_scale_change(scale):
-    update_hitboxes(hit_scale=float(scale))
+    global _pending_update
+    if _pending_update is not None:
+        root.after_cancel(_pending_update)
+    _pending_update = root.after(HITBOX_UPDATE_DELAY_MS, _apply_hitbox_scale, float(scale))
 
 # Initialize customtkinter window
 root = ctk.CTk()
@@ -17,12 +17,58 @@ class PyJClass:
         self.clazz = self.jclass.class_
         self.instance = None
 
+    def _declared_field(self, obfuscated_field_name):
+        field = self.clazz.getDeclaredField(obfuscated_field_name)
+        field.setAccessible(True)
+        return field
+
+    def _declared_method(self, name, obfuscated_method_name, num_params=0, param_types=None, return_type="any"):
+        filtered_methods = [
+            method for method in self.clazz.getDeclaredMethods()
+            if method.getName() == obfuscated_method_name
+            and (num_params == 0 or method.getParameterCount() == num_params)
+        ]
+
+        if param_types:
+            def match_param_types(method):
+                method_param_types = [str(t.getName()) for t in method.getParameterTypes()]
+                return method_param_types == param_types
+
+            filtered_methods = [method for method in filtered_methods if match_param_types(method)]
+
+        if return_type != "any":
+            filtered_methods = [
+                method for method in filtered_methods
+                if str(method.getReturnType().getName()) == return_type
+            ]
+
+        if not filtered_methods:
+            raise AttributeError(f"Нет подходящего метода для '{name}' с указанными параметрами.")
+
+        method = filtered_methods[0]
+        method.setAccessible(True)
+        return method
+
+    def resolve(self, name, num_params=0, param_types=None, return_type="any"):
+        """
+        Resolves a mapped field or method once and returns the accessible
+        java.lang.reflect handle, so hot paths can call get()/invoke() directly.
+        """
+        obfuscated_field_name = self.mappings['fields'].get(name)
+        if obfuscated_field_name:
+            return self._declared_field(obfuscated_field_name)
+
+        obfuscated_method_name = self.mappings['methods'].get(name)
+        if obfuscated_method_name:
+            return self._declared_method(name, obfuscated_method_name, num_params, param_types, return_type)
+
+        raise AttributeError(f"'{self.jclass}' has no attribute '{name}'")
+
     def __getattr__(self, name):
         if name in self.mappings['fields']:
             obfuscated_field_name = self.mappings['fields'].get(name)
             if obfuscated_field_name:
-                field = self.clazz.getDeclaredField(obfuscated_field_name)
-                field.setAccessible(True)
+                field = self._declared_field(obfuscated_field_name)
                 if not self.instance:
                     return field
                 return field.get(self.instance)
@@ -30,38 +76,8 @@ class PyJClass:
         if name in self.mappings['methods']:
             obfuscated_method_name = self.mappings['methods'].get(name)
             if obfuscated_method_name:
-                methods = [
-                    method for method in self.clazz.getDeclaredMethods()
-                    if method.getName() == obfuscated_method_name
-                ]
-
-                def find_matching_method(num_params=0, param_types=None, return_type="any"):
-                    filtered_methods = [
-                        method for method in methods
-                        if (num_params == 0 or method.getParameterCount() == num_params)
-                    ]
-
-                    if param_types:
-                        def match_param_types(method):
-                            method_param_types = [str(t.getName()) for t in method.getParameterTypes()]
-                            return method_param_types == param_types
-
-                        filtered_methods = [method for method in filtered_methods if match_param_types(method)]
-
-                    if return_type != "any":
-                        filtered_methods = [
-                            method for method in filtered_methods
-                            if str(method.getReturnType().getName()) == return_type
-                        ]
-
-                    if not filtered_methods:
-                        raise AttributeError(f"Нет подходящего метода для '{name}' с указанными параметрами.")
-
-                    return filtered_methods[0]
-
                 def method_handler(*args, num_params=0, param_types=None, return_type="any"):
-                    method = find_matching_method(num_params=num_params, param_types=param_types, return_type=return_type)
-                    method.setAccessible(True)
+                    method = self._declared_method(name, obfuscated_method_name, num_params, param_types, return_type)
                     return method.invoke(self.instance, *args)
 
                 return method_handler
@@ -75,8 +91,7 @@ class PyJClass:
         elif name in self.mappings.get('fields', {}):
             obfuscated_field_name = self.mappings['fields'].get(name)
             if obfuscated_field_name:
-                field = self.clazz.getDeclaredField(obfuscated_field_name)
-                field.setAccessible(True)
+                field = self._declared_field(obfuscated_field_name)
                 if not self.instance:
                     raise AttributeError("Instance is not set for setting field values.")
                 field.set(self.instance, value)
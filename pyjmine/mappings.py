@@ -1,7 +1,23 @@
 import requests
-from lxml import html
+from lxml import etree, html
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+import copy
 import re
+import threading
+
+# Precompiled patterns for the per-row name checks
+_SEARGE_MEMBER_RE = re.compile(r'^(?:field_|method_|func_)[0-9]+_[a-zA-Z]$')
+_SHORT_OBF_RE = re.compile(r'^[A-Za-z]{1,4}\Z')
+# Full class names; the matched group tells Yarn (Client/Impl) and Intermediary (class_) apart
+_CLASS_KIND_RE = re.compile(r'^(?:net\.minecraft\.|com\.mojang\.)(?:(?=.*(?:Client|Impl))(?P<yarn>)|(?=.*class_)(?P<intermediary>))?')
+
+# Precompiled XPath queries, parameterized by marker / name cell class
+_XP_FIRST_MARKER_CELL = etree.XPath("(//td[@class=$marker])[1]")
+_XP_MARKED_NAME = etree.XPath(".//td[@class=$marker]/following-sibling::td[@class=$name]")
+_XP_ANY_MARKED_NAME = etree.XPath(".//td[@class]/following-sibling::td[@class=$name]")
+_XP_HAS_MARKED_NAME = etree.XPath("boolean(.//td[@class and following-sibling::td[@class=$name]])")
 
 class MappingsType(Enum):
     MOJANG = 'mojang'
@@ -9,6 +25,84 @@ class MappingsType(Enum):
     INTERMEDIARY = 'intermediary'
     SEARGE = 'searge'
 
+def _cell_text(element):
+    """
+    Returns the stripped text of a cell, skipping the subtree walk of
+    text_content() when the cell holds nothing but text.
+    """
+    if len(element) == 0:
+        return (element.text or '').strip()
+    return element.text_content().strip()
+
+def _member_rows_name_cells(rows):
+    for row in rows:
+        cells = list(row.iterchildren('td'))
+        if len(cells) >= 2:
+            yield cells[1]
+
+def _parse_searge_member_rows(rows, name_cell_class, mapping_keys, mapping_vals):
+    """
+    Appends the Searge and obfuscated name of every member row that has both.
+    """
+    for name_container_td in _member_rows_name_cells(rows):
+        # Check all possible markers for Searge-style names
+        searge_name = None
+        obfuscated_name = None
+
+        for name_element in _XP_ANY_MARKED_NAME(name_container_td, name=name_cell_class):
+            name_text = _cell_text(name_element).partition('(')[0]
+
+            # Check if this looks like a Searge name
+            if _SEARGE_MEMBER_RE.match(name_text):
+                searge_name = name_text
+            elif _SHORT_OBF_RE.match(name_text):
+                obfuscated_name = name_text
+
+        if searge_name and obfuscated_name:
+            mapping_keys.append(searge_name)
+            mapping_vals.append(obfuscated_name)
+
+def _parse_member_rows(rows, obf_marker, mapped_marker, name_cell_class, mapping_keys, mapping_vals):
+    """
+    Appends the mapped and obfuscated name of every member row that has both.
+    Kept free of instance state, with hot lookups bound to locals, since it runs
+    once per row of the largest tables.
+    """
+    append_key = mapping_keys.append
+    append_val = mapping_vals.append
+
+    for name_container_td in _member_rows_name_cells(rows):
+        # Single scan over the nested cells: a name cell belongs to a marker
+        # if that marker appeared on one of its preceding sibling cells
+        mapped_name_element = None
+        obfuscated_name_element = None
+        sibling_classes = {}
+
+        for cell in name_container_td.iterdescendants('td'):
+            cell_class = cell.get('class')
+            seen_classes = sibling_classes.setdefault(cell.getparent(), set())
+
+            if cell_class == name_cell_class:
+                if mapped_name_element is None and mapped_marker in seen_classes:
+                    mapped_name_element = cell
+                if obfuscated_name_element is None and obf_marker in seen_classes:
+                    obfuscated_name_element = cell
+                if mapped_name_element is not None and obfuscated_name_element is not None:
+                    break
+
+            if cell_class:
+                seen_classes.add(cell_class)
+
+        if mapped_name_element is not None and obfuscated_name_element is not None:
+            append_key(_cell_text(mapped_name_element).partition('(')[0])
+            append_val(_cell_text(obfuscated_name_element).partition('(')[0])
+
+# Mapping type for each _CLASS_KIND_RE group; no group means a Mojang or Searge name
+_CLASS_KIND_TYPES = {
+    'yarn': MappingsType.YARN,
+    'intermediary': MappingsType.INTERMEDIARY,
+}
+
 class InvalidMappingTypeError(Exception):
     def __init__(self, version, mapping_type):
         message = f'For versions less than 1.15, use only Searge mappings! Version: {version}, Mapping Type: {mapping_type}'
@@ -26,6 +120,25 @@ class Mappings:
     # Common class for the cell containing the actual name text
     POTENTIAL_NAME_CELL_CLASS = 'F'
 
+    # Limits for the fetch result cache (per instance) and the parsed page cache (shared)
+    FETCH_CACHE_SIZE = 256
+    TREE_CACHE_SIZE = 16
+
+    # Number of pages fetch_many() downloads at once
+    FETCH_WORKERS = 4
+
+    # Parsed pages keyed by URL, shared between instances of any mapping type
+    _tree_cache = OrderedDict()
+    # Guards _tree_cache, which fetch_many() workers update concurrently
+    _tree_cache_lock = threading.Lock()
+
+    # HTTP session per thread, as requests.Session isn't guaranteed to be thread-safe;
+    # consecutive fetches on a thread reuse its TCP/TLS connection
+    _thread_local = threading.local()
+
+    # Selectors known for each version; mappings.dev uses the same markers on every page
+    _detected_cache = {}
+
     def __init__(self, version, mapping_type=MappingsType.MOJANG):
         try:
             minor_version_str = version.split('.')[1]
@@ -37,40 +150,124 @@ class Mappings:
 
         self.version = version
         self.mapping_type_requested = mapping_type
-        self.field_mappings = {}
-        self.method_mappings = {}
+        # Member mappings stored as parallel lists of mapped and obfuscated names
+        self._field_keys = []
+        self._field_vals = []
+        self._method_keys = []
+        self._method_vals = []
         self.mapping_class_name = None
         self.obfuscated_class_name = None
 
         # Dynamically detected selectors
-        self.detected_selectors = {
+        self.detected_selectors = self._default_selectors()
+
+        # Results of fetch() keyed by (version, mapping type, class path)
+        self._fetch_cache = OrderedDict()
+
+    @classmethod
+    def _default_selectors(cls):
+        return {
             'class_name_markers': {}, # To store {MappingsType.MOJANG: 'D G', ...}
             'obfuscated_class_marker': None,
             'searge_class_marker': None, # Separate marker for Searge class names
             'field_method_table_class': None,
-            'name_container_cell_class': self.POTENTIAL_NAME_CELL_CLASS
+            'name_container_cell_class': cls.POTENTIAL_NAME_CELL_CLASS
         }
 
+    @classmethod
+    def preload_selectors(cls, version, selectors):
+        """
+        Registers already known selectors for a version, so fetch() skips detection.
+        Takes the same keys as detected_selectors; missing keys keep their defaults.
+        Detected Searge markers are never cached, so for Searge this is the only way
+        to skip detection and to get a marker that is reliable on every page.
+        """
+        preloaded = cls._default_selectors()
+        preloaded.update(copy.deepcopy(selectors))
+        cls._detected_cache[version] = preloaded
+
+    def _load_selectors(self, tree):
+        """
+        Uses the selectors known for this version, detecting them from the page
+        only when they lack what the requested mapping type needs.
+        """
+        cached_selectors = self._detected_cache.get(self.version)
+        if cached_selectors is not None and self._markers_usable(cached_selectors):
+            self.detected_selectors = copy.deepcopy(cached_selectors)
+            return
+
+        self._detect_selectors(tree)
+
+        # Only remember a detection that found the requested markers on a page with member tables
+        if not self._markers_usable(self.detected_selectors) or not self.detected_selectors['field_method_table_class']:
+            return
+
+        cache_entry = copy.deepcopy(self.detected_selectors)
+        # A detected Searge marker is only a guess (the second full class name on the page)
+        # that doesn't carry over to other pages, so Searge markers are cached only when preloaded
+        cache_entry['searge_class_marker'] = None
+        cache_entry['class_name_markers'].pop(MappingsType.SEARGE, None)
+
+        if cached_selectors is not None:
+            # Detection stops once the requested type is found, keep markers found earlier for other types
+            for mapping_type, marker_class in cached_selectors['class_name_markers'].items():
+                cache_entry['class_name_markers'].setdefault(mapping_type, marker_class)
+            if not cache_entry['searge_class_marker']:
+                cache_entry['searge_class_marker'] = cached_selectors['searge_class_marker']
+
+        self._detected_cache[self.version] = cache_entry
+
+    def _markers_usable(self, selectors):
+        """
+        Tells whether selectors hold the obfuscated marker and the class name marker
+        for the requested mapping type. For Searge a dedicated marker is required,
+        the Mojang fallback in fetch() is only used after a full detection.
+        """
+        if not selectors['obfuscated_class_marker']:
+            return False
+        if self.mapping_type_requested == MappingsType.SEARGE:
+            return bool(selectors['searge_class_marker'])
+        return bool(selectors['class_name_markers'].get(self.mapping_type_requested))
+
+    @staticmethod
+    def _find_fm_table(h4_element, required_classes):
+        """
+        Returns the first table following h4_element that carries every class token
+        in required_classes, or None.
+        """
+        for table in h4_element.itersiblings('table'):
+            if required_classes.issubset(table.get('class', '').split()):
+                return table
+        return None
+
     def _detect_selectors(self, tree):
         """
         Tries to dynamically determine the CSS classes used for marking different mapping types
         based on the content and structure of the HTML.
         """
         print("Attempting to detect selectors...")
+        self.detected_selectors = self._default_selectors()
 
-        # Find definition tables
-        definition_tables = tree.xpath(f"//table[.//td[@class and following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']]]")
+        # Find the first definition table, without testing the tables after it
+        class_def_table = None
+        for table in tree.iter('table'):
+            if _XP_HAS_MARKED_NAME(table, name=self.POTENTIAL_NAME_CELL_CLASS):
+                class_def_table = table
+                break
 
-        if not definition_tables:
+        if class_def_table is None:
             print("Warning: Could not find any potential class definition tables.")
             return
 
-        class_def_table = definition_tables[0]
-        rows = class_def_table.xpath('.//tr')
+        rows = class_def_table.iterdescendants('tr')
         found_types_for_class_names = set()
 
         for row in rows:
-            cells = row.xpath('./td')
+            # Only the markers for the requested mapping type are needed
+            if self._markers_usable(self.detected_selectors):
+                break
+
+            cells = list(row.iterchildren('td'))
             if len(cells) == 2:
                 marker_cell = cells[0]
                 name_cell = cells[1]
@@ -81,44 +278,42 @@ class Mappings:
                 if not marker_class or name_cell_class != self.POTENTIAL_NAME_CELL_CLASS:
                     continue
 
-                class_name_text = name_cell.text_content().strip()
+                class_name_text = _cell_text(name_cell)
                 if not class_name_text:
                     continue
 
                 # Detect obfuscated names (short, typically 1-4 characters)
-                if len(class_name_text) <= 4 and re.match(r'^[a-zA-Z]{1,4}$', class_name_text):
+                if _SHORT_OBF_RE.match(class_name_text):
                     if MappingsType.SEARGE not in found_types_for_class_names:
                         self.detected_selectors['obfuscated_class_marker'] = marker_class
                         found_types_for_class_names.add(MappingsType.SEARGE)
                         print(f"  Detected Obfuscated class marker: '{marker_class}' for name '{class_name_text}'")
+                    continue
 
-                # Detect Searge class names (look for full class names that are Searge style)
-                elif class_name_text.startswith(('net.minecraft.', 'com.mojang.')):
-                    # This is a full class name, determine its type
-                    if 'Client' in class_name_text or 'Impl' in class_name_text:
-                        # Likely Yarn
-                        if MappingsType.YARN not in found_types_for_class_names:
-                            self.detected_selectors['class_name_markers'][MappingsType.YARN] = marker_class
-                            found_types_for_class_names.add(MappingsType.YARN)
-                            print(f"  Detected YARN class marker: '{marker_class}' for name '{class_name_text}'")
-                    elif 'class_' in class_name_text:
-                        # Intermediary
-                        if MappingsType.INTERMEDIARY not in found_types_for_class_names:
-                            self.detected_selectors['class_name_markers'][MappingsType.INTERMEDIARY] = marker_class
-                            found_types_for_class_names.add(MappingsType.INTERMEDIARY)
-                            print(f"  Detected INTERMEDIARY class marker: '{marker_class}' for name '{class_name_text}'")
-                    else:
-                        # Could be Mojang or Searge class name
-                        # Try to distinguish - Searge class names are often the same as Mojang but in a different context
-                        # For now, assume first full class name is Mojang, second is Searge
-                        if MappingsType.MOJANG not in found_types_for_class_names:
-                            self.detected_selectors['class_name_markers'][MappingsType.MOJANG] = marker_class
-                            found_types_for_class_names.add(MappingsType.MOJANG)
-                            print(f"  Detected MOJANG class marker: '{marker_class}' for name '{class_name_text}'")
-                        elif 'searge_class_marker' not in self.detected_selectors or self.detected_selectors['searge_class_marker'] is None:
-                            self.detected_selectors['searge_class_marker'] = marker_class
-                            self.detected_selectors['class_name_markers'][MappingsType.SEARGE] = marker_class
-                            print(f"  Detected SEARGE class marker: '{marker_class}' for name '{class_name_text}'")
+                # Detect full class names and determine their type in a single match
+                class_kind_match = _CLASS_KIND_RE.match(class_name_text)
+                if not class_kind_match:
+                    continue
+
+                class_kind = _CLASS_KIND_TYPES.get(class_kind_match.lastgroup)
+                if class_kind:
+                    # Yarn or Intermediary
+                    if class_kind not in found_types_for_class_names:
+                        self.detected_selectors['class_name_markers'][class_kind] = marker_class
+                        found_types_for_class_names.add(class_kind)
+                        print(f"  Detected {class_kind.name} class marker: '{marker_class}' for name '{class_name_text}'")
+                else:
+                    # Could be Mojang or Searge class name
+                    # Try to distinguish - Searge class names are often the same as Mojang but in a different context
+                    # For now, assume first full class name is Mojang, second is Searge
+                    if MappingsType.MOJANG not in found_types_for_class_names:
+                        self.detected_selectors['class_name_markers'][MappingsType.MOJANG] = marker_class
+                        found_types_for_class_names.add(MappingsType.MOJANG)
+                        print(f"  Detected MOJANG class marker: '{marker_class}' for name '{class_name_text}'")
+                    elif 'searge_class_marker' not in self.detected_selectors or self.detected_selectors['searge_class_marker'] is None:
+                        self.detected_selectors['searge_class_marker'] = marker_class
+                        self.detected_selectors['class_name_markers'][MappingsType.SEARGE] = marker_class
+                        print(f"  Detected SEARGE class marker: '{marker_class}' for name '{class_name_text}'")
 
         # Detect Field/Method table class
         field_summary_h4 = tree.xpath("//h4[text()='Field summary']")
@@ -141,13 +336,78 @@ class Mappings:
 
         print("Selector detection finished.")
 
+    @classmethod
+    def _session(cls):
+        session = getattr(cls._thread_local, 'session', None)
+        if session is None:
+            session = cls._thread_local.session = requests.Session()
+        return session
+
+    def _load_tree(self, url):
+        """
+        Returns the parsed page for url, downloading it only if it is not cached yet.
+        """
+        with self._tree_cache_lock:
+            tree = self._tree_cache.get(url)
+            if tree is not None:
+                self._tree_cache.move_to_end(url)
+                return tree
+
+        # Stream the body straight into lxml's parser instead of buffering it first
+        parser = html.HTMLParser(encoding='utf-8', remove_blank_text=True, remove_comments=True)
+        with self._session().get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            tree = etree.parse(response.raw, parser=parser).getroot()
+
+        with self._tree_cache_lock:
+            self._tree_cache[url] = tree
+            if len(self._tree_cache) > self.TREE_CACHE_SIZE:
+                self._tree_cache.popitem(last=False)
+        return tree
+
+    def _page_url(self, class_path):
+        return f'https://mappings.dev/{self.version}/{class_path.replace(".", "/")}.html'
+
+    def fetch_many(self, class_paths):
+        """
+        Fetches several classes at once and returns their mappings keyed by class path.
+        Pages are downloaded and parsed in parallel, then processed one by one.
+        """
+        # dict.fromkeys drops repeated paths while keeping their order
+        urls = list(dict.fromkeys(
+            self._page_url(class_path) for class_path in class_paths
+            if (self.version, self.mapping_type_requested, class_path) not in self._fetch_cache
+        ))
+        trees = {}
+        if urls:
+            with ThreadPoolExecutor(max_workers=min(self.FETCH_WORKERS, len(urls))) as executor:
+                # Keep the trees here, the page cache may evict them before they are processed
+                trees = dict(zip(urls, executor.map(self._load_tree, urls)))
+
+        return {
+            class_path: self._fetch(class_path, trees.get(self._page_url(class_path)))
+            for class_path in class_paths
+        }
+
     def fetch(self, class_path):
-        url = f'https://mappings.dev/{self.version}/{class_path.replace(".", "/")}.html'
-        response = requests.get(url)
-        response.raise_for_status()
-        tree = html.fromstring(response.content)
+        return self._fetch(class_path)
 
-        self._detect_selectors(tree)
+    def _fetch(self, class_path, tree=None):
+        cache_key = (self.version, self.mapping_type_requested, class_path)
+        cached = self._fetch_cache.get(cache_key)
+        if cached is not None:
+            self._fetch_cache.move_to_end(cache_key)
+            # Keep get() in step with the class that was just fetched
+            self.mapping_class_name = cached['class_name']
+            self.obfuscated_class_name = cached['obfuscated_class_name']
+            # Hand out a copy so callers mutating the result don't poison the cache
+            return copy.deepcopy(cached)
+
+        if tree is None:
+            tree = self._load_tree(self._page_url(class_path))
+
+        self._load_selectors(tree)
 
         # Get the appropriate markers
         obf_marker = self.detected_selectors['obfuscated_class_marker']
@@ -167,20 +427,20 @@ class Mappings:
 
         # Extract class names
         try:
-            obf_class_marker_td = tree.xpath(f"(//td[@class='{obf_marker}'])[1]")[0]
+            obf_class_marker_td = _XP_FIRST_MARKER_CELL(tree, marker=obf_marker)[0]
             class_name_definition_table = obf_class_marker_td.xpath('./ancestor::table[1]')[0]
         except IndexError:
             raise ValueError("Could not re-find the class name definition table using detected markers.")
 
         try:
-            obfuscated_class_element = class_name_definition_table.xpath(f".//td[@class='{obf_marker}']/following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']")[0]
-            self.obfuscated_class_name = obfuscated_class_element.text_content().strip()
+            obfuscated_class_element = _XP_MARKED_NAME(class_name_definition_table, marker=obf_marker, name=self.POTENTIAL_NAME_CELL_CLASS)[0]
+            self.obfuscated_class_name = _cell_text(obfuscated_class_element)
         except IndexError:
             raise ValueError(f"Could not find obfuscated class name using detected marker '{obf_marker}'.")
 
         try:
-            mapping_class_element = class_name_definition_table.xpath(f".//td[@class='{requested_type_marker_class}']/following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']")[0]
-            self.mapping_class_name = mapping_class_element.text_content().strip()
+            mapping_class_element = _XP_MARKED_NAME(class_name_definition_table, marker=requested_type_marker_class, name=self.POTENTIAL_NAME_CELL_CLASS)[0]
+            self.mapping_class_name = _cell_text(mapping_class_element)
         except IndexError:
             raise ValueError(f"Could not find mapping class name for type '{self.mapping_type_requested.name}' using detected marker '{requested_type_marker_class}'.")
 
@@ -189,31 +449,29 @@ class Mappings:
         if not fm_table_classes_str:
             print("Warning: Field/Method table class not detected. Skipping field/method parsing.")
         else:
-            class_conditions = []
-            for cls in fm_table_classes_str.split():
-                if cls.strip():
-                    class_conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {cls.strip()} ')")
-
-            xpath_fm_table_selector_conditions = " and ".join(class_conditions)
-            xpath_fm_table_selector = f"table[{xpath_fm_table_selector_conditions}]"
+            fm_table_classes = frozenset(fm_table_classes_str.split())
 
             # Process fields
             h4_field_summary = tree.xpath("//h4[text()='Field summary']")
             if h4_field_summary:
-                fields_table_candidates = h4_field_summary[0].xpath(f"./following-sibling::{xpath_fm_table_selector}[1]")
-                if fields_table_candidates:
-                    self._process_member_table(fields_table_candidates[0], self.field_mappings)
+                fields_table = self._find_fm_table(h4_field_summary[0], fm_table_classes)
+                if fields_table is not None:
+                    self._process_member_table(fields_table, self._field_keys, self._field_vals)
 
             # Process methods
             h4_method_summary = tree.xpath("//h4[text()='Method summary']")
             if h4_method_summary:
-                methods_table_candidates = h4_method_summary[0].xpath(f"./following-sibling::{xpath_fm_table_selector}[1]")
-                if methods_table_candidates:
-                    self._process_member_table(methods_table_candidates[0], self.method_mappings)
+                methods_table = self._find_fm_table(h4_method_summary[0], fm_table_classes)
+                if methods_table is not None:
+                    self._process_member_table(methods_table, self._method_keys, self._method_vals)
 
-        return self.get()
+        result = self.get()
+        self._fetch_cache[cache_key] = copy.deepcopy(result)
+        if len(self._fetch_cache) > self.FETCH_CACHE_SIZE:
+            self._fetch_cache.popitem(last=False)
+        return result
 
-    def _process_member_table(self, table_element, mapping_dict):
+    def _process_member_table(self, table_element, mapping_keys, mapping_vals):
         obf_member_marker = self.detected_selectors['obfuscated_class_marker']
 
         # For members (fields/methods), determine the appropriate marker
@@ -233,49 +491,33 @@ class Mappings:
             print(f"Warning: Marker for requested type '{self.mapping_type_requested.name}' for members not available.")
             return
 
-        rows = table_element.xpath('./tbody/tr')
-        for row in rows:
-            cells = row.xpath('./td')
-            if len(cells) < 2:
-                continue
-
-            name_container_td = cells[1]
-
-            # Look for Searge-style names (field_XXXXX_X or method_XXXXX_X patterns)
-            if self.mapping_type_requested == MappingsType.SEARGE:
-                # Check all possible markers for Searge-style names
-                all_name_elements = name_container_td.xpath(f".//td[@class]/following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']")
-                searge_name = None
-                obfuscated_name = None
-
-                for name_element in all_name_elements:
-                    name_text = name_element.text_content().strip()
-                    if '(' in name_text:
-                        name_text = name_text.split('(')[0]
-
-                    # Check if this looks like a Searge name
-                    if re.match(r'^(field_|method_|func_)[0-9]+_[a-zA-Z]$', name_text):
-                        searge_name = name_text
-                    elif len(name_text) <= 4 and re.match(r'^[a-zA-Z]{1,4}$', name_text):
-                        obfuscated_name = name_text
-
-                if searge_name and obfuscated_name:
-                    mapping_dict[searge_name] = obfuscated_name
-            else:
-                # Standard processing for other mapping types
-                mapped_name_elements = name_container_td.xpath(f".//td[@class='{requested_type_member_marker}']/following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']")
-                obfuscated_name_elements = name_container_td.xpath(f".//td[@class='{obf_member_marker}']/following-sibling::td[@class='{self.POTENTIAL_NAME_CELL_CLASS}']")
-
-                if mapped_name_elements and obfuscated_name_elements:
-                    mapping_name = mapped_name_elements[0].text_content().strip()
-                    obfuscated_name = obfuscated_name_elements[0].text_content().strip()
-
-                    if '(' in mapping_name:
-                        mapping_name = mapping_name.split('(')[0]
-                    if '(' in obfuscated_name:
-                        obfuscated_name = obfuscated_name.split('(')[0]
-
-                    mapping_dict[mapping_name] = obfuscated_name
+        rows = (row for tbody in table_element.iterchildren('tbody') for row in tbody.iterchildren('tr'))
+
+        # Look for Searge-style names (field_XXXXX_X or method_XXXXX_X patterns)
+        if self.mapping_type_requested == MappingsType.SEARGE:
+            _parse_searge_member_rows(rows, self.POTENTIAL_NAME_CELL_CLASS, mapping_keys, mapping_vals)
+        else:
+            _parse_member_rows(rows, obf_member_marker, requested_type_member_marker,
+                               self.POTENTIAL_NAME_CELL_CLASS, mapping_keys, mapping_vals)
+
+    # The properties return a new dict on each access; assign a whole dict to replace the mappings
+    @property
+    def field_mappings(self):
+        return dict(zip(self._field_keys, self._field_vals))
+
+    @field_mappings.setter
+    def field_mappings(self, mappings):
+        self._field_keys = list(mappings.keys())
+        self._field_vals = list(mappings.values())
+
+    @property
+    def method_mappings(self):
+        return dict(zip(self._method_keys, self._method_vals))
+
+    @method_mappings.setter
+    def method_mappings(self, mappings):
+        self._method_keys = list(mappings.keys())
+        self._method_vals = list(mappings.values())
 
     def get(self):
         return {